@@ -1,8 +1,21 @@
 
-import csv, random, math
+import csv, math, os, zlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from itertools import repeat
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from typing import Dict, Tuple, Optional, FrozenSet, Callable
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernel then runs as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
 
 # ------------------------------
 # Config and scaling parameters
@@ -24,6 +37,10 @@ SHOWER_THERMS = 0.10  # per shower
 DISHWASHER_THERMS = 0.05  # per day if present
 LAUNDRY_DAILY_RANGE = (0.08, 0.10)  # if water heater present and occupancy 2-4
 
+# Heating bands (upper-inclusive °F thresholds) and base multipliers, see heating_for_temp
+_THRESH = np.array([40, 50, 60, 70], dtype=np.float32)
+_MULT = np.array([1.2, 0.9, 0.6, 0.3, 0.0], dtype=np.float32)
+
 # Dryer rules
 DRYER_THERMS_PER_LOAD = 0.30
 
@@ -35,9 +52,32 @@ COOKING_EVENT_SIZES = {
     "dinner": (0.025, 0.035),
 }
 
+# Daily presence probability of each cooking event; 1-person summer homes cook less
+COOKING_PROBS = {
+    "summer": {"breakfast": 0.6, "lunch": 0.25, "dinner": 0.9},
+    "winter": {"breakfast": 0.75, "lunch": 0.4, "dinner": 0.9},  # higher presence in winter
+}
+COOKING_PROBS_SUMMER_SINGLE = {"breakfast": 0.30, "dinner": 0.80}
+
 # Variation
 VARIATION_PCT = (0.10, 0.15)  # +-10-15%
 
+# Output CSV header
+OUTPUT_COLUMNS = ["date", "time", "temp", "usage_therms", "avg_usage", "season", "home_sqft", "occupancy", "appliances"]
+
+# Below this many total hours a config runs serially: generation costs ~3µs/hour, while each
+# pool worker pays ~0.5-1s to import pandas/numba (plus JIT compile on a cold cache)
+PARALLEL_MIN_HOURS = 500_000
+
+# Meal order (column order) of the per-day cooking arrays passed to the kernel
+MEALS = ("breakfast", "lunch", "dinner")
+
+# Appliance flag bits selecting the usage kernel variant
+FLAG_FURNACE = 1  # heating term; only set in winter
+FLAG_STOVE = 2
+FLAG_WATER_HEATER = 4
+FLAG_DRYER = 8
+
 
 @dataclass
 class Scenario:
@@ -51,88 +91,93 @@ class Scenario:
     temps_csv: str   # path to a CSV with columns: date,time,temp
     out_csv: str     # output path
 
-def frand(a: float, b: float) -> float:
-    return random.uniform(a, b)
-
-def with_variation(val: float) -> float:
-    sign = 1 if random.random() < 0.5 else -1
-    pct = frand(*VARIATION_PCT)
-    return max(0.0, val * (1 + sign * pct))
-
-def parse_datetime(d: str, t: str) -> datetime:
-    return datetime.strptime(f"{d} {t}", "%Y-%m-%d %H:%M:%S")
-
-def daterange(start: datetime, end: datetime):
-    cur = start
-    while cur <= end:
-        yield cur
-        cur += timedelta(hours=1)
-
-def load_temps(temps_csv: str) -> Dict[datetime, float]:
-    temps: Dict[datetime, float] = {}
-    with open(temps_csv, newline="") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            dt = parse_datetime(row["date"], row["time"])
-            temps[dt] = float(row["temp"])
-    return temps
+def with_variation(vals: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    # +-10-15% on non-zero hours only (zero hours stay zero, so they draw nothing).
+    # One uniform draw in [-1, 1) per hour: its sign picks +/-, its magnitude the 10-15% band.
+    mask = vals > 0
+    u = rng.uniform(-1.0, 1.0, size=int(mask.sum()))
+    lo, hi = VARIATION_PCT
+    out = vals.copy()
+    out[mask] *= 1 + np.sign(u) * (lo + (hi - lo) * np.abs(u))
+    return np.maximum(0.0, out)
+
+def load_temps(temps_csv: str, fallback: float = 72.0) -> Tuple[np.datetime64, np.ndarray]:
+    # Returns (first hour, dense hourly float32 temps); missing hours and blank temps filled with fallback
+    df = pd.read_csv(temps_csv, dtype={"date": str, "time": str, "temp": "float32"})
+    # Dates repeat 24x, so the cached date parse only runs once per day; HH:MM:SS is a timedelta
+    dt = pd.to_datetime(df["date"], format="%Y-%m-%d", cache=True) + pd.to_timedelta(df["time"])
+    temps = pd.Series(df["temp"].to_numpy(), index=dt).dropna()
+    temps = temps[~temps.index.duplicated(keep="last")]
+    full = pd.date_range(dt.min().floor("h"), dt.max(), freq="h")
+    temps = temps.reindex(full, fill_value=fallback)
+    return np.datetime64(full[0], "h"), temps.to_numpy(dtype=np.float32)
+
+def temps_for_hours(temps_start: np.datetime64, temps: np.ndarray, start: datetime, n: int, fallback: float = 72.0) -> np.ndarray:
+    # Gathers n hourly temps beginning at start; hours outside the file get fallback
+    offset = int((np.datetime64(start, "h") - temps_start) // np.timedelta64(1, "h"))
+    idx = offset + np.arange(n)
+    inside = (idx >= 0) & (idx < len(temps))
+    return np.where(inside, temps[np.clip(idx, 0, len(temps) - 1)], np.float32(fallback))
 
 def base_heating_rate_sqft(home_sqft: int) -> float:
     # base_heating = 0.12 × (sqft/2000) at the 50-60°F band baseline
     return 0.12 * (home_sqft / 2000.0)
 
-def heating_for_temp(temp_f: float, base_heating: float) -> float:
+def heating_for_temp(temp_f: np.ndarray, base_heating: float) -> np.ndarray:
     # HEATING FORMULA (Winter only):
     # Above 70°F: 0
     # 60-70°F: base × 0.3
     # 50-60°F: base × 0.6
     # 40-50°F: base × 0.9
     # Below 40°F: base × 1.2
-    if temp_f > 70:
-        return 0.0
-    if temp_f > 60:
-        return base_heating * 0.3
-    if temp_f > 50:
-        return base_heating * 0.6
-    if temp_f > 40:
-        return base_heating * 0.9
-    return base_heating * 1.2
-
-def choose_event_hours(season: str, occupancy: int) -> Dict[str, List[int]]:
-    # Returns hours for breakfast/lunch/dinner events for a day
+    # Branchless band lookup: searchsorted (side="left") maps t <= 40 -> 0, 40 < t <= 50 -> 1, ...
+    # temp_f must be finite: NaN sorts past every threshold and would land in the 0.0 band
+    # (load_temps fills NaN with the fallback and generate_scenario rejects non-finite temps).
+    return base_heating * _MULT[np.searchsorted(_THRESH, temp_f)]
+
+def choose_event_hours(season: str, occupancy: int, rng: np.random.Generator, ndays: int) -> Dict[str, np.ndarray]:
+    # Returns hours for breakfast/lunch/dinner events, one entry per day
     # Summer guide suggests peaks at 7am, 11am, 6-8pm, winter similar overlay.
-    # We pick specific hours with some randomness.
+    # We pick specific hours with some randomness; -1 means no event.
     breakfast_hour = 7  # 7am
     dinner_hour = 18    # start at 6pm
 
     # Optional lunch at 11am with some chance
-    lunch_hours = []
-    if random.random() < 0.4:
-        lunch_hours = [11]
+    lunch_hours = np.where(rng.random(ndays) < 0.4, 11, -1)
 
     # Breakfast probability differs for 1-person summer special case, but we keep general
     return {
-        "breakfast": [breakfast_hour],
+        "breakfast": np.full(ndays, breakfast_hour),
         "lunch": lunch_hours,
-        "dinner": [dinner_hour + random.choice([0, 1, 2])],  # 6-8pm window
+        "dinner": dinner_hour + rng.choice([0, 1, 2], size=ndays),  # 6-8pm window
     }
 
-def showers_for_day(occupancy: int) -> List[int]:
-    # Each person 1 shower/day at ~7am or ~8pm
-    hours = []
-    for _ in range(occupancy):
-        hours.append(random.choice([7, 20]))
-    return hours
+def cooking_probs(season: str, occupancy: int) -> np.ndarray:
+    # Presence probability per meal in MEALS order
+    probs = dict(COOKING_PROBS["summer" if season == "summer" else "winter"])
+    if season == "summer" and occupancy == 1:
+        probs.update(COOKING_PROBS_SUMMER_SINGLE)
+    return np.array([probs[m] for m in MEALS])
+
+def showers_for_day(occupancy: int, rng: np.random.Generator, ndays: int) -> np.ndarray:
+    # Each person picks ~7am or ~8pm per day; (ndays, 24) mask of hours with any shower.
+    # Boolean like the original `hour in s_hours` test: several people at one hour still
+    # add a single SHOWER_THERMS, so daily shower usage is 0.10-0.20 therms, not occupancy × 0.10.
+    hours = rng.choice([7, 20], size=(ndays, occupancy))
+    mask = np.zeros((ndays, 24), dtype=bool)
+    mask[np.arange(ndays)[:, None], hours] = True
+    return mask
 
 def dryer_load_hours_for_week(occupancy: int) -> int:
     # Frequency: (occupancy/2) loads per week, round to nearest int >= 0
     return max(0, round(occupancy / 2))
 
-def distribute_dryer_hours(start_date: datetime, end_date: datetime, occupancy: int) -> Dict[datetime, int]:
-    # Returns a mapping of datetimes for which dryer runs happen (one hour per load)
+def distribute_dryer_hours(start_date: datetime, end_date: datetime, occupancy: int, rng: np.random.Generator) -> FrozenSet[int]:
+    # Returns the hour offsets from start_date (a midnight) at which dryer runs happen (one hour per load)
     loads_per_week = dryer_load_hours_for_week(occupancy)
+    last_hour = int((end_date - start_date).total_seconds() // 3600)
     day = start_date
-    dryer_times = {}
+    dryer_hours = set()
     while day <= end_date:
         # For each week block
         week_start = day
@@ -140,18 +185,62 @@ def distribute_dryer_hours(start_date: datetime, end_date: datetime, occupancy:
         candidate_hours = []
         for i in range(7):
             d = week_start + timedelta(days=i)
+            midnight = (d - start_date).days * 24
             is_weekend = d.weekday() >= 5
             if is_weekend:
-                candidate_hours.extend([(d, h) for h in range(10, 14)])
+                candidate_hours.extend([midnight + h for h in range(10, 14)])
             else:
-                candidate_hours.extend([(d, h) for h in range(19, 22)])
-        random.shuffle(candidate_hours)
-        for j in range(loads_per_week):
-            if j < len(candidate_hours):
-                d, h = candidate_hours[j]
-                dryer_times[datetime(d.year, d.month, d.day, h, 0, 0)] = 1
+                candidate_hours.extend([midnight + h for h in range(19, 22)])
+        for j in rng.permutation(len(candidate_hours))[:loads_per_week]:
+            if 0 <= candidate_hours[j] <= last_hour:
+                dryer_hours.add(candidate_hours[j])
         day = week_start + timedelta(days=7)
-    return dryer_times
+    return frozenset(dryer_hours)
+
+def _make_usage_kernel(flags: int) -> Callable:
+    # Builds the per-hour accumulation kernel for one appliance mix. The closure flags are
+    # compile-time constants for Numba, so terms for absent appliances drop out of the loop.
+    with_heat = bool(flags & FLAG_FURNACE)
+    with_stove = bool(flags & FLAG_STOVE)
+    with_showers = bool(flags & FLAG_WATER_HEATER)
+    with_dryer = bool(flags & FLAG_DRYER)
+
+    @njit(cache=True)
+    def _compute_usage(heat, hour_of_day, day_idx, day_rand, meal_hours, meal_probs, meal_sizes,
+                       shower_mask, dryer_mask):
+        # Heating + cooking + shower + dryer usage per hour (before variation).
+        # heat is the precomputed hourly heating load; shower_mask is (ndays, 24).
+        # day_rand/meal_hours/meal_sizes are (ndays, 3) presence draws, event hours (-1 = none)
+        # and occupancy-scaled event sizes in MEALS order.
+        n = hour_of_day.shape[0]
+        usage = np.zeros(n, dtype=np.float32)
+        for i in range(n):
+            h = hour_of_day[i]
+            d = day_idx[i]
+            u = 0.0
+            if with_heat:
+                u += heat[i]
+            if with_stove:
+                for k in range(3):
+                    if h == meal_hours[d, k] and day_rand[d, k] < meal_probs[k]:
+                        u += meal_sizes[d, k]
+            if with_showers and shower_mask[d, h]:
+                u += SHOWER_THERMS
+            if with_dryer and dryer_mask[i]:
+                u += DRYER_THERMS_PER_LOAD
+            usage[i] = u
+        return usage
+
+    return _compute_usage
+
+_USAGE_KERNELS: Dict[int, Callable] = {}
+
+def usage_kernel(flags: int) -> Callable:
+    # One specialized kernel per flags bitmask (at most 16), built on first use
+    kernel = _USAGE_KERNELS.get(flags)
+    if kernel is None:
+        kernel = _USAGE_KERNELS[flags] = _make_usage_kernel(flags)
+    return kernel
 
 def target_daily_avg(season: str, occupancy: int, home_sqft: int) -> float:
     # Returns a reasonable target daily total based on prompt ranges, used for avg_usage column
@@ -184,18 +273,38 @@ def target_daily_avg(season: str, occupancy: int, home_sqft: int) -> float:
 def clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
+def scenario_seed(scenario_id: str) -> int:
+    # Stable across runs and worker processes (str hash() is salted per process)
+    return RNG_SEED + zlib.crc32(scenario_id.encode("utf-8")) % 1000000
+
 def generate_scenario(sc: Scenario):
-    random.seed(RNG_SEED + hash(sc.scenario_id) % 1000000)
+    # One generator drives every draw in the scenario (dryer schedule, cooking, showers, variation)
+    rng = np.random.Generator(np.random.PCG64(scenario_seed(sc.scenario_id)))
 
     # Load temps
-    temps = load_temps(sc.temps_csv)
+    temps_start, temps = load_temps(sc.temps_csv)
 
-    start_dt = datetime.strptime(sc.start_date, "%Y-%m-%d")
-    end_dt = datetime.strptime(sc.end_date, "%Y-%m-%d")
+    start_dt = datetime.fromisoformat(sc.start_date)
+    end_dt = datetime.fromisoformat(sc.end_date)
     # Align to hour
     start_dt = start_dt.replace(hour=0, minute=0, second=0)
     end_dt = end_dt.replace(hour=23, minute=0, second=0)
 
+    # Hourly axis as integer counters from start_dt (midnight)
+    n = int((end_dt - start_dt).total_seconds() // 3600) + 1
+    if n <= 0:
+        # end_date before start_date: header-only CSV, as the old hourly loop wrote
+        with open(sc.out_csv, "w", newline="") as f:
+            csv.writer(f).writerow(OUTPUT_COLUMNS)
+        return
+    hour_idx = np.arange(n)
+    hour_of_day = hour_idx % 24
+    day_idx = hour_idx // 24
+    ndays = int(day_idx[-1]) + 1
+    temp_arr = temps_for_hours(temps_start, temps, start_dt, n)  # 72.0 fallback if missing
+    if not np.isfinite(temp_arr).all():
+        raise ValueError(f"Scenario {sc.scenario_id}: non-finite temps from {sc.temps_csv}")
+
     # Appliance flags
     has_furnace = "furnace" in sc.appliances
     has_stove = "stove" in sc.appliances
@@ -203,135 +312,104 @@ def generate_scenario(sc: Scenario):
     has_dryer = "dryer" in sc.appliances
 
     # Precompute dryer schedule if needed
-    dryer_hours_map = {}
+    dryer_hours = frozenset()
     if has_dryer:
-        dryer_hours_map = distribute_dryer_hours(start_dt, end_dt, sc.occupancy)
+        dryer_hours = distribute_dryer_hours(start_dt, end_dt, sc.occupancy, rng)
 
-    # Prepare output
-    out_rows = []
     base_heat = base_heating_rate_sqft(sc.home_sqft) if has_furnace else 0.0
 
     # avg_usage column: daily target / 24
     daily_target = target_daily_avg(sc.season, sc.occupancy, sc.home_sqft)
     avg_usage_col = round(daily_target / 24.0, 6)
-
-    # Iterate per hour
-    cur = start_dt
-    last_written_date = None
-
-    while cur <= end_dt:
-        dstr = cur.strftime("%Y-%m-%d")
-        tstr = cur.strftime("%H:%M:%S")
-        temp = float(temps.get(cur, 72.0))  # fallback if missing
-
-        usage = 0.0
-
-        # Season logic
-        if sc.season == "summer":
-            # No heating in summer
-            if has_stove:
-                # Cooking sparse events
-                hours = choose_event_hours(sc.season, sc.occupancy)
-                # Decide breakfast and dinner presence per day only once
-                day_seed = hash((sc.scenario_id, dstr)) % 100000
-                rnd = random.Random(day_seed)
-                # Breakfast probability (special for 1-person)
-                breakfast_prob = 0.30 if sc.occupancy == 1 else 0.6
-                dinner_prob = 0.80 if sc.occupancy == 1 else 0.9
-                lunch_prob = 0.25
-
-                if cur.hour in hours["breakfast"] and rnd.random() < breakfast_prob:
-                    ev = rnd.uniform(*COOKING_EVENT_SIZES["breakfast"])
-                    ev *= COOKING_RULES.get(sc.occupancy, {"factor":1.0})["factor"]
-                    usage += ev
-
-                if cur.hour in hours["dinner"] and rnd.random() < dinner_prob:
-                    ev = rnd.uniform(*COOKING_EVENT_SIZES["dinner"])
-                    ev *= COOKING_RULES.get(sc.occupancy, {"factor":1.0})["factor"]
-                    usage += ev
-
-                if hours["lunch"] and cur.hour in hours["lunch"] and rnd.random() < lunch_prob:
-                    ev = rnd.uniform(*COOKING_EVENT_SIZES["lunch"])
-                    ev *= COOKING_RULES.get(sc.occupancy, {"factor":1.0})["factor"]
-                    usage += ev
-
-            if has_water_heater:
-                # Showers: occupancy × 0.10 therms per day at 7 or 20
-                s_hours = showers_for_day(sc.occupancy)
-                if cur.hour in s_hours:
-                    usage += SHOWER_THERMS
-
-            if has_dryer:
-                if cur in dryer_hours_map:
-                    usage += DRYER_THERMS_PER_LOAD
-
-            # Zero usage 90-95% of hours naturally emerges since events are sparse
-
-        else:  # winter
-            if has_furnace:
-                heat = heating_for_temp(temp, base_heat)
-                usage += heat
-
-            # Overlay activities
-            if has_stove:
-                hours = choose_event_hours(sc.season, sc.occupancy)
-                day_seed = hash((sc.scenario_id, dstr)) % 100000
-                rnd = random.Random(day_seed + 42)
-                # Higher presence in winter
-                if cur.hour in hours["breakfast"] and rnd.random() < 0.75:
-                    ev = rnd.uniform(*COOKING_EVENT_SIZES["breakfast"])
-                    ev *= COOKING_RULES.get(sc.occupancy, {"factor":1.0})["factor"]
-                    usage += ev
-                if hours["lunch"] and cur.hour in hours["lunch"] and rnd.random() < 0.4:
-                    ev = rnd.uniform(*COOKING_EVENT_SIZES["lunch"])
-                    ev *= COOKING_RULES.get(sc.occupancy, {"factor":1.0})["factor"]
-                    usage += ev
-                if cur.hour in hours["dinner"] and rnd.random() < 0.9:
-                    ev = rnd.uniform(*COOKING_EVENT_SIZES["dinner"])
-                    ev *= COOKING_RULES.get(sc.occupancy, {"factor":1.0})["factor"]
-                    usage += ev
-
-            if has_water_heater:
-                s_hours = showers_for_day(sc.occupancy)
-                if cur.hour in s_hours:
-                    usage += SHOWER_THERMS
-
-            if has_dryer and cur in dryer_hours_map:
-                usage += DRYER_THERMS_PER_LOAD
-
-        # Variation to avoid robotic patterns
-        if usage > 0:
-            usage = with_variation(usage)
-
-        # Guardrails
-        usage = max(0.0, round(usage, 3))
-
-        out_rows.append({
-            "date": dstr,
-            "time": tstr,
-            "temp": int(round(temp)),
-            "usage_therms": f"{usage:.3f}",
-            "avg_usage": f"{avg_usage_col:.6f}",
-            "season": sc.season,
-            "home_sqft": sc.home_sqft,
-            "occupancy": sc.occupancy,
-            "appliances": sc.appliances,
-        })
-        cur += timedelta(hours=1)
-
-    # Write CSV
-    with open(sc.out_csv, "w", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=["date","time","temp","usage_therms","avg_usage","season","home_sqft","occupancy","appliances"])
-        w.writeheader()
-        w.writerows(out_rows)
-
-
-def run_from_config(config_csv: str):
-    # Read scenarios and run one by one
+    avg_str = f"{avg_usage_col:.6f}"  # constant per scenario, formatted once
+
+    # Heating only in winter; summer has none
+    has_heat = sc.season != "summer" and has_furnace
+    flags = ((FLAG_FURNACE if has_heat else 0) | (FLAG_STOVE if has_stove else 0)
+             | (FLAG_WATER_HEATER if has_water_heater else 0) | (FLAG_DRYER if has_dryer else 0))
+
+    # Cooking: event hours, presence and size decided per day only once
+    # (summer has no heating; zero usage 90-95% of hours emerges since events are sparse)
+    if has_stove:
+        hours = choose_event_hours(sc.season, sc.occupancy, rng, ndays)
+        meal_hours = np.column_stack([hours[m] for m in MEALS])
+        # One (ndays, 3) block each for presence draws and event sizes, rows = days
+        size_lo, size_hi = np.array([COOKING_EVENT_SIZES[m] for m in MEALS]).T
+        day_rand = rng.random((ndays, len(MEALS)))
+        meal_sizes = rng.uniform(size_lo, size_hi, size=(ndays, len(MEALS)))
+        meal_sizes *= COOKING_RULES.get(sc.occupancy, {"factor":1.0})["factor"]
+    else:
+        meal_hours = np.full((ndays, len(MEALS)), -1)
+        day_rand = np.ones((ndays, len(MEALS)))
+        meal_sizes = np.zeros((ndays, len(MEALS)))
+    prob_arr = cooking_probs(sc.season, sc.occupancy)
+
+    # Showers: SHOWER_THERMS at 7 and/or 20 on hours someone picked (see showers_for_day)
+    shower_mask = np.zeros((ndays, 24), dtype=bool)
+    if has_water_heater:
+        shower_mask = showers_for_day(sc.occupancy, rng, ndays)
+
+    dryer_mask = np.zeros(n, dtype=bool)
+    if dryer_hours:
+        dryer_mask[np.fromiter(dryer_hours, dtype=int)] = True
+
+    # Usage is float32 end to end (3-decimal output), temps are written as int16
+    heat = np.zeros(n, dtype=np.float32)
+    if has_heat:
+        heat = heating_for_temp(temp_arr, base_heat)
+
+    usage = usage_kernel(flags)(
+        heat, hour_of_day, day_idx, day_rand, meal_hours, prob_arr, meal_sizes,
+        shower_mask, dryer_mask,
+    )
+
+    # Variation to avoid robotic patterns
+    usage = with_variation(usage, rng)
+
+    # Guardrails
+    usage = np.maximum(0.0, np.round(usage, 3))
+
+    # Output lookup tables: date string per day, time string per hour of day
+    date_strs = [(start_dt + timedelta(days=d)).strftime("%Y-%m-%d") for d in range(ndays)]
+    time_strs = np.array([f"{h:02d}:00:00" for h in range(24)])
+    # float -> int casts don't raise on NaN/inf; temps were validated right after loading
+    assert np.isfinite(temp_arr).all()
+    temps_out = np.rint(temp_arr).astype(np.int16)
+
+    # Write CSV one day at a time through a buffered writer, so only one day of
+    # formatted strings exists at once
+    with open(sc.out_csv, "w", newline="", buffering=1 << 16) as f:
+        w = csv.writer(f)
+        w.writerow(OUTPUT_COLUMNS)
+        for d in range(ndays):
+            lo = d * 24
+            hi = min(n, lo + 24)
+            w.writerows(zip(
+                repeat(date_strs[d]),
+                time_strs[hour_of_day[lo:hi]].tolist(),
+                temps_out[lo:hi].tolist(),
+                np.char.mod("%.3f", usage[lo:hi]).tolist(),
+                repeat(avg_str),
+                repeat(sc.season),
+                repeat(sc.home_sqft),
+                repeat(sc.occupancy),
+                repeat(sc.appliances),
+            ))
+
+
+def scenario_hours(sc: Scenario) -> int:
+    # Hours generate_scenario will produce (whole days, midnight to 23:00)
+    days = (datetime.fromisoformat(sc.end_date) - datetime.fromisoformat(sc.start_date)).days + 1
+    return max(0, days) * 24
+
+def run_from_config(config_csv: str, workers: Optional[int] = None):
+    # Read scenarios, then run them in parallel if the workload is big enough to pay for
+    # worker startup (each scenario is independent: own seed, own output file)
+    scenarios = []
     with open(config_csv, newline="") as f:
         r = csv.DictReader(f)
         for row in r:
-            sc = Scenario(
+            scenarios.append(Scenario(
                 scenario_id=row["scenario_id"],
                 season=row["season"].lower(),
                 start_date=row["start_date"],
@@ -341,12 +419,26 @@ def run_from_config(config_csv: str):
                 appliances=row["appliances"].lower(),
                 temps_csv=row["temps_csv"],
                 out_csv=row["out_csv"],
-            )
+            ))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+        if sum(scenario_hours(sc) for sc in scenarios) < PARALLEL_MIN_HOURS:
+            workers = 1
+    workers = min(workers, len(scenarios))
+
+    if workers <= 1:
+        for sc in scenarios:
             generate_scenario(sc)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(generate_scenario, scenarios, chunksize=1))
 
 if __name__ == "__main__":
     import argparse
     ap = argparse.ArgumentParser()
     ap.add_argument("--config", required=True, help="Path to scenarios.csv")
+    ap.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count for large configs, serial for small ones; 1 = serial)")
     args = ap.parse_args()
-    run_from_config(args.config)
+    run_from_config(args.config, args.workers)
@@ -17,8 +17,10 @@ plt.figure(figsize=(10, 6))
 colors = ['#2E86C1', '#5DADE2', '#E67E22', '#DC7633']
 
 for i, (title, file) in enumerate(datasets.items(), 1):
-    df = pd.read_csv(file)
-    df["hour"] = pd.to_datetime(df["time"], format="%H:%M:%S").dt.hour
+    # Only the two columns we plot; "HH:00:00" hour is sliced, not datetime-parsed
+    df = pd.read_csv(file, engine="pyarrow", usecols=["time", "usage_therms"],
+                     dtype={"time": str, "usage_therms": "float32"})
+    df["hour"] = df["time"].str.slice(0, 2).astype(int)
     hourly_avg = df.groupby("hour")["usage_therms"].mean()
     
     plt.subplot(2, 2, i)
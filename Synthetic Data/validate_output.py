@@ -1,4 +1,6 @@
-import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.compute as pc
 import matplotlib.pyplot as plt
 from pathlib import Path
 
@@ -21,14 +23,18 @@ for file in files:
         print(f"❌ Missing file: {file}")
         continue
 
-    df = pd.read_csv(path)
-    df["usage_therms"] = df["usage_therms"].astype(float)
+    # One read (only the columns we need), then all stats on the arrow table
+    tbl = pv.read_csv(path, convert_options=pv.ConvertOptions(
+        include_columns=["date", "usage_therms"],
+        column_types={"date": pa.string(), "usage_therms": pa.float32()},
+    ))
     
     # ---- Validation Stats ----
-    zero_hours = (df["usage_therms"] == 0).sum()
-    total_hours = len(df)
+    zero_hours = pc.sum(pc.equal(tbl["usage_therms"], 0)).as_py()
+    total_hours = tbl.num_rows
     zero_pct = round(zero_hours / total_hours * 100, 2)
-    daily_total = df.groupby("date")["usage_therms"].sum().mean()
+    daily = tbl.group_by("date").aggregate([("usage_therms", "sum")]).sort_by("date")
+    daily_total = pc.mean(daily["usage_therms_sum"]).as_py()
     
     print(f"\n✅ {file}")
     print(f"   Rows: {total_hours}")
@@ -36,8 +42,8 @@ for file in files:
     print(f"   Zero-usage hours: {zero_pct}%")
 
     # ---- Visualization ----
-    # Aggregate by day for smoother visualization
-    daily_usage = df.groupby("date")["usage_therms"].sum().reset_index()
+    # Aggregate by day for smoother visualization (daily sums from above)
+    daily_usage = daily.select(["date", "usage_therms_sum"]).rename_columns(["date", "usage_therms"]).to_pandas()
 
     plt.figure(figsize=(10, 4))
     plt.plot(daily_usage["date"], daily_usage["usage_therms"], marker="o", linestyle="-", label="Daily Usage")